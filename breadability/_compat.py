@@ -27,6 +27,13 @@ except ImportError:
     import urllib.request as urllib
     assert urllib
 
+try:
+    from urllib import unquote_plus
+    assert unquote_plus
+except ImportError:
+    from urllib.parse import unquote_plus
+    assert unquote_plus
+
 
 def unicode_compatible(cls):
     """
@@ -33,7 +33,9 @@ logger = logging.getLogger("breadability")
 
 
 TAG_MARK_PATTERN = re.compile(to_bytes(r"</?[^>]*>\s*"))
-UTF8_PARSER = HTMLParser(encoding="utf8")
+# the parser is shared by all documents, IDs are never looked up through
+# the libxml2 hash table so it isn't built at all
+UTF8_PARSER = HTMLParser(encoding="utf8", collect_ids=False)
 CHARSET_META_TAG_PATTERN = re.compile(
     br"""<meta[^>]+charset=["']?([^'"/>\s]+)""",
     re.IGNORECASE
@@ -2,16 +2,25 @@
 
 from __future__ import absolute_import
 
+import re
 import logging
 
 from copy import deepcopy
 from operator import attrgetter
 from pprint import PrettyPrinter
-from lxml.html.clean import Cleaner
-from lxml.etree import tounicode, tostring
+from lxml.etree import (
+    Comment,
+    Element,
+    ProcessingInstruction,
+    strip_elements,
+    tounicode,
+    tostring,
+)
+from lxml.html.defs import link_attrs
 from lxml.html import fragment_fromstring, fromstring
 
-from .document import OriginalDocument
+from ._compat import unquote_plus
+from .document import OriginalDocument, UTF8_PARSER
 from .annotated_text import AnnotatedTextHandler
 from .scoring import (
     get_class_weight,
@@ -22,16 +31,27 @@ from .scoring import (
 from .utils import cached_property, shrink_text
 
 
-html_cleaner = Cleaner(
-    scripts=True, javascript=True, comments=True,
-    style=True, links=True, meta=False, add_nofollow=False,
-    page_structure=False, processing_instructions=True,
-    embedded=False, frames=False, forms=False,
-    annoying_tags=False, remove_tags=None, kill_tags=("noscript", "iframe"),
-    remove_unknown_tags=False, safe_attrs_only=False)
-
-
-SCORABLE_TAGS = ("div", "p", "td", "pre", "article")
+# elements removed from the document together with their content
+JUNK_TAGS = ("script", "style", "noscript", "iframe", "link")
+# schemes of links which may run a script, the same as lxml Cleaner uses
+SCRIPT_SCHEMES_PATTERN = re.compile(
+    r"(javascript|jscript|livescript|vbscript|data|about|mocha):",
+    re.IGNORECASE)
+IMAGE_DATA_URL_PATTERN = re.compile(r"data:image/(.+?);base64,", re.IGNORECASE)
+UNSAFE_IMAGE_TYPE_PATTERN = re.compile(r"xml|svg", re.IGNORECASE)
+LINK_SPACES_PATTERN = re.compile(r"[\s\x00-\x08\x0B\x0C\x0E-\x19]+")
+META_REFRESH_URL_PATTERN = re.compile(
+    r"[^;=]*;\s*(?:url\s*=\s*)?(?P<url>.*)$", re.IGNORECASE)
+
+
+# tag sets checked for every element of the document
+SCORABLE_TAGS = frozenset(("div", "p", "td", "pre", "article"))
+BLOCK_TAGS = frozenset(("div", "p"))
+EMBED_TAGS = frozenset(("object", "embed"))
+HEADING_TAGS = frozenset(("h1", "h2", "h3", "h4"))
+MINOR_HEADING_TAGS = frozenset(("h3", "h4"))
+CONDITIONALLY_CLEANED_TAGS = frozenset(("form", "table", "ul", "div", "p"))
+CONDITIONAL_COUNTED_TAGS = ("p", "img", "li", "input", "embed")
 ANNOTATION_TAGS = (
     "a", "abbr", "acronym", "b", "big", "blink", "blockquote", "br", "cite",
     "code", "dd", "del", "dir", "dl", "dt", "em", "font", "h", "h1", "h2",
@@ -48,18 +68,83 @@ NULL_DOCUMENT = """
     </body>
 </html>
 """
+# parsed just once, every full document gets its own copy of the tree
+_NULL_DOCUMENT_TREE = fromstring(NULL_DOCUMENT, parser=UTF8_PARSER)
 
 logger = logging.getLogger("breadability")
 
 
+def strip_junk(document):
+    """
+    Removes scripts, styles, frames, external links, comments and
+    processing instructions from the document. In-line styles, event
+    handlers and javascript links are removed from the rest of elements.
+    """
+    strip_elements(
+        document, Comment, ProcessingInstruction, *JUNK_TAGS,
+        with_tail=False)
+
+    for element in document.iter(Element):
+        # browsers treat <image> like <img>, so do we
+        if element.tag == "image":
+            element.tag = "img"
+
+        attributes = element.attrib
+        for name, value in attributes.items():
+            if name == "style" or name.startswith("on"):
+                del attributes[name]
+            elif name in link_attrs and is_script_link(value):
+                attributes[name] = ""
+
+        if element.tag == "meta":
+            neutralize_meta_refresh(element)
+
+    return document
+
+
+def neutralize_meta_refresh(element):
+    """Removes the URL of <meta> refresh if it's a script link."""
+    if element.get("http-equiv", "").lower() != "refresh":
+        return
+
+    content = element.get("content", "")
+    match = META_REFRESH_URL_PATTERN.match(content)
+    start = match.start("url") if match else 0
+    if is_script_link(content[start:]):
+        element.set("content", content[:start])
+
+
+def is_script_link(link):
+    """
+    Checks the link for schemes which may run a script. Base64 encoded
+    data URLs of images are allowed unless they are SVG/XML ones.
+    """
+    # links like "j a v a s c r i p t:" might be interpreted by browsers
+    link = LINK_SPACES_PATTERN.sub("", unquote_plus(link))
+
+    safe_images_count = 0
+    for image_type in IMAGE_DATA_URL_PATTERN.findall(link):
+        if UNSAFE_IMAGE_TYPE_PATTERN.search(image_type):
+            return True
+        safe_images_count += 1
+
+    return len(SCRIPT_SCHEMES_PATTERN.findall(link)) > safe_images_count
+
+
 def ok_embedded_video(node):
-    """Check if this embed/video is an ok one to count."""
+    """
+    Check if this embed/video is an ok one to count.
+
+    Only attributes (src, data, param values, ...) of the node and its
+    descendants are searched, the subtree isn't serialized.
+    """
     good_keywords = ('youtube', 'blip.tv', 'vimeo')
 
-    node_str = tounicode(node)
-    for key in good_keywords:
-        if key in node_str:
-            return True
+    for element in node.iter(Element):
+        for value in element.attrib.values():
+            for key in good_keywords:
+                if key in value:
+                    return True
 
     return False
 
@@ -75,7 +160,8 @@ def build_base_document(dom, return_fragment=True):
     body_element = dom.find(".//body")
 
     if body_element is None:
-        fragment = fragment_fromstring('<div id="readabilityBody"/>')
+        fragment = fragment_fromstring(
+            '<div id="readabilityBody"/>', parser=UTF8_PARSER)
         fragment.append(dom)
     else:
         body_element.tag = "div"
@@ -93,7 +179,8 @@ def build_error_document(dom, return_fragment=True):
         Otherwise full HTML document is returned.
     """
     fragment = fragment_fromstring(
-        '<div id="readabilityBody" class="parsing-error"/>')
+        '<div id="readabilityBody" class="parsing-error"/>',
+        parser=UTF8_PARSER)
 
     return document_from_fragment(fragment, return_fragment)
 
@@ -102,7 +189,7 @@ def document_from_fragment(fragment, return_fragment):
     if return_fragment:
         document = fragment
     else:
-        document = fromstring(NULL_DOCUMENT)
+        document = deepcopy(_NULL_DOCUMENT_TREE)
         body_element = document.find(".//body")
         body_element.append(fragment)
 
@@ -115,34 +202,35 @@ def check_siblings(candidate_node, candidate_list):
     Looks through siblings for content that might also be related.
     Things like preambles, content split by ads that we removed, etc.
     """
-    candidate_css = candidate_node.node.get("class")
+    candidate = candidate_node.node
+    candidate_css = candidate.get("class")
     potential_target = candidate_node.content_score * 0.2
     sibling_target_score = potential_target if potential_target > 10 else 10
-    parent = candidate_node.node.getparent()
-    siblings = parent.getchildren() if parent is not None else []
+    parent = candidate.getparent()
+    # snapshot of the children, siblings are moved under the candidate below
+    siblings = list(parent) if parent is not None else []
+    appended_siblings = []
 
     for sibling in siblings:
-        append = False
-        content_bonus = 0
-
-        if sibling is candidate_node.node:
-            append = True
-
-        # Give a bonus if sibling nodes and top candidates have the example
-        # same class name
-        if candidate_css and sibling.get("class") == candidate_css:
-            content_bonus += candidate_node.content_score * 0.2
-
-        if sibling in candidate_list:
-            adjusted_score = \
-                candidate_list[sibling].content_score + content_bonus
-
-            if adjusted_score >= sibling_target_score:
-                append = True
-
-        if sibling.tag == "p":
-            link_density = get_link_density(sibling)
+        # the candidate itself is always kept, the rest is evaluated lazily
+        # so the costly text checks are skipped once the sibling is accepted
+        append = sibling is candidate
+
+        if not append:
+            scored_sibling = candidate_list.get(sibling)
+            if scored_sibling is not None:
+                # Give a bonus if sibling nodes and top candidates have
+                # the example same class name
+                content_bonus = 0
+                if candidate_css and sibling.get("class") == candidate_css:
+                    content_bonus = potential_target
+
+                adjusted_score = scored_sibling.content_score + content_bonus
+                append = adjusted_score >= sibling_target_score
+
+        if not append and sibling.tag == "p":
             content = sibling.text_content()
+            link_density = get_link_density(sibling, content)
             content_length = len(content)
 
             if content_length > 80 and link_density < 0.25:
@@ -154,14 +242,17 @@ def check_siblings(candidate_node, candidate_list):
         if append:
             logger.debug(
                 "Sibling appended: %s %r", sibling.tag, sibling.attrib)
-            if sibling.tag not in ("div", "p"):
+            if sibling.tag not in BLOCK_TAGS:
                 # We have a node that isn't a common block level element, like
                 # a form or td tag. Turn it into a div so it doesn't get
                 # filtered out later by accident.
                 sibling.tag = "div"
 
-            if candidate_node.node != sibling:
-                candidate_node.node.append(sibling)
+            if sibling is not candidate:
+                appended_siblings.append(sibling)
+
+    # the siblings are moved all at once after the whole loop
+    candidate.extend(appended_siblings)
 
     return candidate_node
 
@@ -176,33 +267,36 @@ def clean_document(node):
 
     for n in node.iter():
         # clean out any in-line style properties
-        if "style" in n.attrib:
-            n.set("style", "")
+        attributes = n.attrib
+        if "style" in attributes:
+            del attributes["style"]
 
         # remove embended objects unless it's wanted video
-        if n.tag in ("object", "embed") and not ok_embedded_video(n):
+        if n.tag in EMBED_TAGS and not ok_embedded_video(n):
             logger.debug("Dropping node %s %r", n.tag, n.attrib)
             to_drop.append(n)
 
         # clean headings with bad css or high link density
-        if n.tag in ("h1", "h2", "h3", "h4") and get_class_weight(n) < 0:
+        if n.tag in HEADING_TAGS and get_class_weight(n) < 0:
             logger.debug("Dropping <%s>, it's insignificant", n.tag)
             to_drop.append(n)
 
-        if n.tag in ("h3", "h4") and get_link_density(n) > 0.33:
+        if n.tag in MINOR_HEADING_TAGS and get_link_density(n) > 0.33:
             logger.debug("Dropping <%s>, it's insignificant", n.tag)
             to_drop.append(n)
 
         # drop block element without content and children
-        if n.tag in ("div", "p"):
-            text_content = shrink_text(n.text_content())
-            if len(text_content) < 5 and not n.getchildren():
+        node_text = None
+        if n.tag in BLOCK_TAGS:
+            node_text = n.text_content()
+            text_content = shrink_text(node_text)
+            if len(text_content) < 5 and len(n) == 0:
                 logger.debug(
                     "Dropping %s %r without content.", n.tag, n.attrib)
                 to_drop.append(n)
 
         # finally try out the conditional cleaning of the target node
-        if clean_conditionally(n):
+        if clean_conditionally(n, node_text):
             to_drop.append(n)
 
     drop_nodes_with_parents(to_drop)
@@ -216,17 +310,39 @@ def drop_nodes_with_parents(nodes):
             continue
 
         node.drop_tree()
-        logger.debug(
-            "Dropped node with parent %s %r %s",
-            node.tag,
-            node.attrib,
-            node.text_content()[:50]
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Dropped node with parent %s %r %s",
+                node.tag,
+                node.attrib,
+                node.text_content()[:50]
+            )
 
 
-def clean_conditionally(node):
-    """Remove the clean_el if it looks like bad content based on rules."""
-    if node.tag not in ('form', 'table', 'ul', 'div', 'p'):
+def count_descendants(node, tags):
+    """
+    Counts descendants of the node with given tags in a single pass over
+    the subtree. Embedded objects are counted only if they are wanted video.
+    """
+    counts = dict.fromkeys(tags, 0)
+    for descendant in node.iterdescendants(*tags):
+        tag = descendant.tag
+        if tag == 'embed' and not ok_embedded_video(descendant):
+            continue
+
+        counts[tag] += 1
+
+    return counts
+
+
+def clean_conditionally(node, node_text=None):
+    """
+    Remove the clean_el if it looks like bad content based on rules.
+
+    :parameter string node_text:
+        Text content of given node if it was obtained before.
+    """
+    if node.tag not in CONDITIONALLY_CLEANED_TAGS:
         return  # this is not the tag we are looking for
 
     weight = get_class_weight(node)
@@ -239,7 +355,8 @@ def clean_conditionally(node):
         logger.debug('Weight + score < 0')
         return True
 
-    commas_count = node.text_content().count(',')
+    content = node.text_content() if node_text is None else node_text
+    commas_count = content.count(',')
     if commas_count < 10:
         logger.debug(
             "There are %d commas so we're processing more.", commas_count)
@@ -247,49 +364,56 @@ def clean_conditionally(node):
         # If there are not very many commas, and the number of
         # non-paragraph elements is more than paragraphs or other ominous
         # signs, remove the element.
-        p = len(node.findall('.//p'))
-        img = len(node.findall('.//img'))
-        li = len(node.findall('.//li')) - 100
-        inputs = len(node.findall('.//input'))
-
-        embed = 0
-        embeds = node.findall('.//embed')
-        for e in embeds:
-            if ok_embedded_video(e):
-                embed += 1
-        link_density = get_link_density(node)
-        content_length = len(node.text_content())
-
-        remove_node = False
-
-        if li > p and node.tag != 'ul' and node.tag != 'ol':
-            logger.debug('Conditional drop: li > p and not ul/ol')
-            remove_node = True
-        elif inputs > p / 3.0:
-            logger.debug('Conditional drop: inputs > p/3.0')
-            remove_node = True
-        elif content_length < 25 and (img == 0 or img > 2):
-            logger.debug('Conditional drop: len < 25 and 0/>2 images')
-            remove_node = True
-        elif weight < 25 and link_density > 0.2:
-            logger.debug('Conditional drop: weight small (%f) and link is dense (%f)', weight, link_density)
-            remove_node = True
-        elif weight >= 25 and link_density > 0.5:
-            logger.debug('Conditional drop: weight big but link heavy')
-            remove_node = True
-        elif (embed == 1 and content_length < 75) or embed > 1:
-            logger.debug(
-                'Conditional drop: embed w/o much content or many embed')
-            remove_node = True
+        counts = count_descendants(node, CONDITIONAL_COUNTED_TAGS)
+        link_density = get_link_density(node, content)
+        remove_node = should_drop_conditionally(
+            node.tag, weight, counts, link_density, len(content))
 
         if remove_node:
-            logger.debug('Node will be removed: %s %r %s', node.tag, node.attrib, node.text_content()[:30])
+            logger.debug('Node will be removed: %s %r %s', node.tag, node.attrib, content[:30])
 
         return remove_node
 
     return False  # nope, don't remove anything
 
 
+def should_drop_conditionally(tag, weight, counts, link_density,
+                              content_length):
+    """
+    Decides about conditional removal of the node only from the numbers
+    gathered by `clean_conditionally`, the tree isn't touched here.
+    """
+    p = counts['p']
+    img = counts['img']
+    li = counts['li'] - 100
+    inputs = counts['input']
+    embed = counts['embed']
+
+    remove_node = False
+
+    if li > p and tag != 'ul' and tag != 'ol':
+        logger.debug('Conditional drop: li > p and not ul/ol')
+        remove_node = True
+    elif inputs > p / 3.0:
+        logger.debug('Conditional drop: inputs > p/3.0')
+        remove_node = True
+    elif content_length < 25 and (img == 0 or img > 2):
+        logger.debug('Conditional drop: len < 25 and 0/>2 images')
+        remove_node = True
+    elif weight < 25 and link_density > 0.2:
+        logger.debug('Conditional drop: weight small (%f) and link is dense (%f)', weight, link_density)
+        remove_node = True
+    elif weight >= 25 and link_density > 0.5:
+        logger.debug('Conditional drop: weight big but link heavy')
+        remove_node = True
+    elif (embed == 1 and content_length < 75) or embed > 1:
+        logger.debug(
+            'Conditional drop: embed w/o much content or many embed')
+        remove_node = True
+
+    return remove_node
+
+
 def prep_article(doc):
     """Once we've found our target article we want to clean it up.
 
@@ -307,22 +431,28 @@ def find_candidates(document):
     Finds cadidate nodes for the readable version of the article.
 
     Here's we're going to remove unlikely nodes, find scores on the rest,
-    clean up and return the final best match.
+    clean up and return the final best match. Leaf <div> elements are turned
+    into paragraphs in the same pass over the document.
     """
-    nodes_to_score = set()
-    should_remove = set()
+    # every element is visited exactly once so plain lists are enough and
+    # keep the nodes in document order
+    nodes_to_score = []
+    should_remove = []
 
     for node in document.iter():
+        if node.tag == "div":
+            leaf_div_element_into_paragraph(node)
+
         if is_unlikely_node(node):
             logger.debug(
                 "We should drop unlikely: %s %r", node.tag, node.attrib)
-            should_remove.add(node)
+            should_remove.append(node)
         elif is_bad_link(node):
             logger.debug(
                 "We should drop bad link: %s %r", node.tag, node.attrib)
-            should_remove.add(node)
+            should_remove.append(node)
         elif node.tag in SCORABLE_TAGS:
-            nodes_to_score.add(node)
+            nodes_to_score.append(node)
 
     return score_candidates(nodes_to_score), should_remove
 
@@ -376,9 +506,7 @@ class Article(object):
         """Parsed lxml tree (Document Object Model) of the given html."""
         try:
             dom = self._original_document.dom
-            # cleaning doesn't return, just wipes in place
-            html_cleaner(dom)
-            return leaf_div_elements_into_paragraphs(dom)
+            return strip_junk(dom)
         except ValueError:
             return None
 
@@ -414,16 +542,18 @@ class Article(object):
             return self._handle_no_candidates()
 
         # right now we return the highest scoring candidate content
-        best_candidates = sorted(
-            (c for c in self.candidates.values()),
-            key=attrgetter("content_score"), reverse=True)
+        winner = max(
+            self.candidates.values(), key=attrgetter("content_score"))
 
-        printer = PrettyPrinter(indent=2)
-        logger.debug(printer.pformat(best_candidates))
+        if logger.isEnabledFor(logging.DEBUG):
+            best_candidates = sorted(
+                self.candidates.values(),
+                key=attrgetter("content_score"), reverse=True)
+            printer = PrettyPrinter(indent=2)
+            logger.debug(printer.pformat(best_candidates))
 
         # since we have several candidates, check the winner's siblings
         # for extra content
-        winner = best_candidates[0]
         updated_winner = check_siblings(winner, self.candidates)
         updated_winner.node = prep_article(updated_winner.node)
         if updated_winner.node is not None:
@@ -438,7 +568,7 @@ class Article(object):
 
     def _remove_orphans(self, dom):
         for node in dom.iterdescendants():
-            if len(node) == 1 and tuple(node)[0].tag == node.tag:
+            if len(node) == 1 and node[0].tag == node.tag:
                 node.drop_tag()
 
         return dom
@@ -463,14 +593,21 @@ def leaf_div_elements_into_paragraphs(document):
     Turn some block elements that don't have children block level
     elements into <p> elements.
 
-    Since we can't change the tree as we iterate over it, we must do this
-    before we process our document.
+    The same transformation is done by `find_candidates` while it looks
+    for the candidates, so the document doesn't have to be walked twice.
     """
-    for element in document.iter(tag="div"):
-        child_tags = tuple(n.tag for n in element.getchildren())
-        if "div" not in child_tags and "p" not in child_tags:
-            logger.debug(
-                "Changing leaf block element <%s> into <p>", element.tag)
-            element.tag = "p"
+    for element in document.iter("div"):
+        leaf_div_element_into_paragraph(element)
 
     return document
+
+
+def leaf_div_element_into_paragraph(element):
+    """
+    Turns the <div> element into <p> if it has no <div> or <p> children.
+    Only the tag is changed so it's safe to call while iterating the tree.
+    """
+    if not any(child.tag in BLOCK_TAGS for child in element):
+        logger.debug(
+            "Changing leaf block element <%s> into <p>", element.tag)
+        element.tag = "p"
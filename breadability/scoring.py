@@ -9,7 +9,7 @@ import re
 import logging
 
 from hashlib import md5
-from lxml.etree import tostring
+from lxml.etree import tostring, XPath
 from ._compat import to_bytes
 from .utils import normalize_whitespace
 
@@ -36,6 +36,9 @@ CLS_WEIGHT_NEGATIVE = re.compile(
     "tool|widget",
     re.IGNORECASE
 )
+# XPath expressions evaluated for every scored node are compiled just once.
+DESCENDANT_LINKS = XPath(".//a")
+DESCENDANT_IMAGES = XPath(".//img")
 
 logger = logging.getLogger("breadability")
 
@@ -91,10 +94,11 @@ def get_link_density(node, node_text=None):
     if text_length == 0:
         return 0.0
 
-    links_length = sum(map(_get_normalized_text_length, node.findall(".//a")))
+    links = DESCENDANT_LINKS(node)
+    links_length = sum(map(_get_normalized_text_length, links))
     # Give 50 bonus chars worth of length for each img.
     # Tweaking this 50 down a notch should help if we hit false positives.
-    img_bonuses = 50 * len(node.findall(".//img"))
+    img_bonuses = 50 * len(DESCENDANT_IMAGES(node))
     links_length = max(0, links_length - img_bonuses)
 
     return links_length / text_length
@@ -112,15 +116,15 @@ def get_class_weight(node):
     """
     weight = 0
 
-    if check_node_attributes(CLS_WEIGHT_NEGATIVE, node, "class"):
-        weight -= 25
-    if check_node_attributes(CLS_WEIGHT_POSITIVE, node, "class"):
-        weight += 25
+    for attribute_name in ("class", "id"):
+        attribute = node.get(attribute_name)
+        if not attribute:
+            continue
 
-    if check_node_attributes(CLS_WEIGHT_NEGATIVE, node, "id"):
-        weight -= 25
-    if check_node_attributes(CLS_WEIGHT_POSITIVE, node, "id"):
-        weight += 25
+        if CLS_WEIGHT_NEGATIVE.search(attribute):
+            weight -= 25
+        if CLS_WEIGHT_POSITIVE.search(attribute):
+            weight += 25
 
     return weight
 
@@ -132,16 +136,24 @@ def is_unlikely_node(node):
     If the class or id are in the unlikely list, and there's not also a
     class/id in the likely list then it might need to be removed.
     """
-    unlikely = check_node_attributes(CLS_UNLIKELY, node, "class", "id")
-    maybe = check_node_attributes(CLS_MAYBE, node, "class", "id")
+    if node.tag == "body":
+        return False
+
+    # the patterns contain no whitespace so a match can't span both values
+    # and one search over the joined attributes is enough
+    attributes = "%s %s" % (node.get("class") or "", node.get("id") or "")
+    if not CLS_UNLIKELY.search(attributes):
+        return False
 
-    return bool(unlikely and not maybe and node.tag != "body")
+    return not CLS_MAYBE.search(attributes)
 
 
 def score_candidates(nodes):
     """Given a list of potential nodes, find some initial scores to start"""
     MIN_HIT_LENTH = 25
     candidates = {}
+    # the tree isn't modified while scoring so texts may be reused
+    texts = {}
 
     for node in nodes:
         logger.debug("* Scoring candidate %s %r", node.tag, node.attrib)
@@ -159,7 +171,8 @@ def score_candidates(nodes):
             continue
 
         # if paragraph is < `MIN_HIT_LENTH` characters don't even count it
-        inner_text = node.text_content().strip()
+        node_text = texts[node] = node.text_content()
+        inner_text = node_text.strip()
         if len(inner_text) < MIN_HIT_LENTH:
             logger.debug(
                 "Skipping candidate - inner text < %d characters.",
@@ -213,7 +226,8 @@ def score_candidates(nodes):
         candidates[node].content_score += content_score
 
     for candidate in candidates.values():
-        adjustment = 1.0 - get_link_density(candidate.node)
+        node_text = texts.get(candidate.node)
+        adjustment = 1.0 - get_link_density(candidate.node, node_text)
         candidate.content_score *= adjustment
         logger.debug(
             "Link density adjustment for %s %r: %f",
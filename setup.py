@@ -21,7 +21,7 @@ with open(join(CURRENT_DIRECTORY, "README.rst")) as readme:
 install_requires = [
     "docopt>=0.6.1,<0.7",
     "chardet",
-    "lxml>=2.0",
+    "lxml>=3.4",
 ]
 tests_require = [
     "pytest",
@@ -12,24 +12,27 @@ from ...compat import unittest
 class TestAntipopeBlog(unittest.TestCase):
     """Test the scoring and parsing of the Blog Post"""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Load up the article for us"""
         article_path = os.path.join(os.path.dirname(__file__), 'article.html')
-        self.article = open(article_path).read()
+        with open(article_path, 'rb') as file:
+            cls.article = file.read()
+        cls.document = Article(cls.article)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Drop the article"""
-        self.article = None
+        cls.article = None
+        cls.document = None
 
     def test_parses(self):
         """Verify we can parse the document."""
-        doc = Article(self.article)
-        self.assertTrue('id="readabilityBody"' in doc.readable)
+        self.assertTrue('id="readabilityBody"' in self.document.readable)
 
     def test_comments_cleaned(self):
         """The div with the comments should be removed."""
-        doc = Article(self.article)
-        self.assertTrue('class="comments"' not in doc.readable)
+        self.assertTrue('class="comments"' not in self.document.readable)
 
     def test_beta_removed(self):
         """The id=beta element should be removed
@@ -38,5 +41,4 @@ class TestAntipopeBlog(unittest.TestCase):
         removed.
 
         """
-        doc = Article(self.article)
-        self.assertTrue('id="beta"' not in doc.readable)
+        self.assertTrue('id="beta"' not in self.document.readable)
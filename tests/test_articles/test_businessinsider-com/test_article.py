@@ -11,23 +11,25 @@ from breadability.readable import Article
 class TestBusinessInsiderArticle(unittest.TestCase):
     """Test the scoring and parsing of the Blog Post"""
 
-    def setUp(self):
-
+    @classmethod
+    def setUpClass(cls):
         """Load up the article for us"""
         article_path = os.path.join(os.path.dirname(__file__), 'article.html')
-        self.article = open(article_path).read()
+        with open(article_path, 'rb') as file:
+            cls.article = file.read()
+        cls.document = Article(cls.article)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Drop the article"""
-        self.article = None
+        cls.article = None
+        cls.document = None
 
     def test_parses(self):
         """Verify we can parse the document."""
-        doc = Article(self.article)
-        self.assertTrue('id="readabilityBody"' in doc.readable)
+        self.assertTrue('id="readabilityBody"' in self.document.readable)
 
     def test_images_preserved(self):
         """The div with the comments should be removed."""
-        doc = Article(self.article)
-        self.assertTrue('bharath-kumar-a-co-founder-at-pugmarksme-suggests-working-on-a-sunday-late-night.jpg' in doc.readable)
-        self.assertTrue('bryan-guido-hassin-a-university-professor-and-startup-junkie-uses-airplane-days.jpg' in doc.readable)
+        self.assertTrue('bharath-kumar-a-co-founder-at-pugmarksme-suggests-working-on-a-sunday-late-night.jpg' in self.document.readable)
+        self.assertTrue('bryan-guido-hassin-a-university-professor-and-startup-junkie-uses-airplane-days.jpg' in self.document.readable)
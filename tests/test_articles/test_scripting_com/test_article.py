@@ -19,27 +19,30 @@ from ...compat import unittest
 class TestArticle(unittest.TestCase):
     """Test the scoring and parsing of the Article"""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Load up the article for us"""
         article_path = os.path.join(os.path.dirname(__file__), 'article.html')
-        self.article = open(article_path).read()
+        with open(article_path, 'rb') as file:
+            cls.article = file.read()
+        cls.document = Article(cls.article)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Drop the article"""
-        self.article = None
+        cls.article = None
+        cls.document = None
 
     def test_parses(self):
         """Verify we can parse the document."""
-        doc = Article(self.article)
-        self.assertTrue('id="readabilityBody"' in doc.readable)
+        self.assertTrue('id="readabilityBody"' in self.document.readable)
 
     def test_content_exists(self):
         """Verify that some content exists."""
-        doc = Article(self.article)
-        self.assertTrue('Amazon and Google' in doc.readable)
-        self.assertFalse('Linkblog updated' in doc.readable)
+        self.assertTrue('Amazon and Google' in self.document.readable)
+        self.assertFalse('Linkblog updated' in self.document.readable)
         self.assertFalse(
-            '#anExampleGoogleDoesntIntendToShareBlogAndItWill' in doc.readable)
+            '#anExampleGoogleDoesntIntendToShareBlogAndItWill' in self.document.readable)
 
     @unittest.skip("Test fails because of some weird hash.")
     def test_candidates(self):
@@ -9,11 +9,18 @@ from lxml.html import fragment_fromstring
 from breadability._compat import to_unicode
 from breadability.readable import (
     Article,
+    clean_document,
+    count_descendants,
+    document_from_fragment,
+    find_candidates,
     get_class_weight,
     get_link_density,
     is_bad_link,
+    ok_embedded_video,
     leaf_div_elements_into_paragraphs,
     score_candidates,
+    should_drop_conditionally,
+    strip_junk,
 )
 from breadability.scoring import ScoredNode
 from .compat import unittest
@@ -45,6 +52,18 @@ class TestReadableDocument(unittest.TestCase):
         self.assertEqual(readable.findall(".//style"), [])
         self.assertEqual(readable.findall(".//link"), [])
 
+    def test_full_documents_are_independent(self):
+        """Every full document is built from its own copy of template."""
+        first = document_from_fragment(
+            fragment_fromstring("<div>first</div>"), False)
+        second = document_from_fragment(
+            fragment_fromstring("<div>second</div>"), False)
+
+        self.assertEqual(first.tag, "html")
+        self.assertEqual(first.find(".//body").text_content().strip(), "first")
+        self.assertEqual(
+            second.find(".//body").text_content().strip(), "second")
+
     def test_find_body_exists(self):
         """If the document has a body, we store that as the readable html
 
@@ -143,6 +162,22 @@ class TestCleaning(unittest.TestCase):
                 '<html><body><p>simple<a href="">link</a></p></body></html>')
         )
 
+    def test_find_candidates_transforms_misused_divs(self):
+        """Leaf divs are replaced by p's while candidates are searched."""
+        dom = document_fromstring(
+            "<html><body><div>text<div>child</div>"
+            "aftertext</div></body></html>"
+        )
+        find_candidates(dom)
+
+        self.assertEqual(
+            tounicode(dom),
+            to_unicode(
+                "<html><body><div>text<p>child</p>"
+                "aftertext</div></body></html>"
+            )
+        )
+
     def test_dont_transform_div_with_div(self):
         """Verify that only child <div> element is replaced by <p>."""
         dom = document_fromstring(
@@ -159,6 +194,123 @@ class TestCleaning(unittest.TestCase):
             )
         )
 
+    def test_count_descendants(self):
+        """Descendants are counted by tag, the node itself is not."""
+        node = fragment_fromstring(
+            "<div><p>first</p><div><p>second</p><img src='a.png'/>"
+            "<embed src='http://www.youtube.com/v/1'/>"
+            "<embed src='http://example.com/flash.swf'/></div></div>")
+
+        counts = count_descendants(node, ("p", "img", "div", "embed", "li"))
+        self.assertEqual(counts, {
+            "p": 2, "img": 1, "div": 1, "embed": 1, "li": 0,
+        })
+
+    def test_strip_junk(self):
+        """Scripts, comments and javascript are removed, text is kept."""
+        dom = document_fromstring(
+            '<html><head><link rel="stylesheet" href="s.css"></head><body>'
+            '<p onclick="alert(1)">one<!-- note -->two</p>'
+            '<script>var a = 1;</script>three'
+            '<a href="java script:alert(1)">link</a></body></html>')
+
+        self.assertEqual(
+            tounicode(strip_junk(dom)),
+            to_unicode(
+                '<html><head/><body><p>onetwo</p>three'
+                '<a href="">link</a></body></html>')
+        )
+
+    def test_strip_junk_script_schemes(self):
+        """Links to data, about and other script schemes are emptied."""
+        dom = document_fromstring(
+            '<html><head><meta http-equiv="refresh" '
+            'content="0;url=javascript:alert(1)"></head><body>'
+            '<a href="data:text/html,&lt;script&gt;alert(1)">data</a>'
+            '<a href="about:blank">about</a>'
+            '<img src="data:image/png;base64,AAAA">'
+            '<img src="data:image/svg+xml;base64,AAAA">'
+            '<a href="http://example.com/">ok</a></body></html>')
+
+        self.assertEqual(
+            tounicode(strip_junk(dom)),
+            to_unicode(
+                '<html><head><meta http-equiv="refresh" content="0;url="/>'
+                '</head><body><a href="">data</a><a href="">about</a>'
+                '<img src="data:image/png;base64,AAAA"/><img src=""/>'
+                '<a href="http://example.com/">ok</a></body></html>')
+        )
+
+    def test_strip_junk_keeps_meta_refresh_to_page(self):
+        """Refresh to a regular page is kept as it is."""
+        dom = document_fromstring(
+            '<html><head><meta http-equiv="refresh" '
+            'content="5; URL=http://example.com/"></head></html>')
+        meta = strip_junk(dom).find(".//meta")
+
+        self.assertEqual(meta.get("content"), "5; URL=http://example.com/")
+
+    def test_strip_junk_image_into_img(self):
+        """Elements <image> are renamed to <img> like browsers do."""
+        dom = document_fromstring(
+            '<html><body><p><image src="a.png"></p></body></html>')
+
+        self.assertEqual(len(strip_junk(dom).findall(".//img")), 1)
+
+    def test_should_drop_conditionally(self):
+        """Every rule of the conditional cleaning decides on its own."""
+        def counts(p=0, img=1, li=0, input=0, embed=0):
+            return {"p": p, "img": img, "li": li, "input": input,
+                    "embed": embed}
+
+        # (tag, weight, counts, link density, content length, dropped)
+        cases = [
+            ("div", 0, counts(li=101), 0.0, 100, True),
+            ("ul", 0, counts(li=101), 0.0, 100, False),
+            ("ol", 0, counts(li=101), 0.0, 100, False),
+            ("div", 0, counts(p=3, input=2), 0.0, 100, True),
+            ("div", 0, counts(p=3, input=1), 0.0, 100, False),
+            ("div", 0, counts(img=0), 0.0, 20, True),
+            ("div", 0, counts(img=3), 0.0, 20, True),
+            ("div", 0, counts(img=1), 0.0, 20, False),
+            ("div", 0, counts(), 0.3, 100, True),
+            ("div", 0, counts(), 0.2, 100, False),
+            ("div", 25, counts(), 0.6, 100, True),
+            ("div", 25, counts(), 0.4, 100, False),
+            ("div", 0, counts(embed=1), 0.0, 50, True),
+            ("div", 0, counts(embed=1), 0.0, 100, False),
+            ("div", 0, counts(embed=2), 0.0, 500, True),
+        ]
+
+        for tag, weight, tag_counts, density, length, dropped in cases:
+            result = should_drop_conditionally(
+                tag, weight, tag_counts, density, length)
+            self.assertEqual(result, dropped, (tag, weight, tag_counts,
+                                               density, length))
+
+    def test_inline_styles_removed(self):
+        """In-line style attributes are removed from the cleaned document."""
+        node = fragment_fromstring(
+            '<div><p style="color: red">This is a paragraph with some '
+            'words in it.</p><p>And just another paragraph of text.</p></div>')
+
+        cleaned = clean_document(node)
+        self.assertEqual(cleaned.xpath(".//*[@style]"), [])
+
+    def test_ok_embedded_video(self):
+        """Only embedded objects pointing to known video sites are ok."""
+        video = fragment_fromstring(
+            '<object><param name="movie" '
+            'value="http://www.youtube.com/v/1"></object>')
+        self.assertTrue(ok_embedded_video(video))
+
+        embed = fragment_fromstring('<embed src="http://vimeo.com/1">')
+        self.assertTrue(ok_embedded_video(embed))
+
+        other = fragment_fromstring(
+            '<embed src="http://example.com/flash.swf">')
+        self.assertFalse(ok_embedded_video(other))
+
     def test_bad_links(self):
         """Some links should just not belong."""
         bad_links = [